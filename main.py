@@ -1,3 +1,4 @@
+import html
 import sys
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QStackedWidget, QVBoxLayout, QLabel, QPushButton,
@@ -11,6 +12,73 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 
 
+DESIGNERS = ["VAA", "MVM", "KRG", "BRL", "BAS"]
+
+
+def compute_summary(data):
+    """Сводные показатели для панели на главной странице.
+
+    Возвращает None, если в листе нет нужных столбцов; артикулы
+    могут быть и числами:
+
+    >>> data = pd.DataFrame({
+    ...     "Предмет": ["Футболки", "Худи"],
+    ...     "Выкупили, шт": [3, 2],
+    ...     "Выкупили на сумму, ₽": [300, 500],
+    ...     "Артикул продавца": [101, 102],
+    ... })
+    >>> summary = compute_summary(data)
+    >>> summary["units"], summary["revenue"], summary["categories"], summary["designers"]
+    (5, 800.0, 2, 0)
+    >>> compute_summary(data.drop(columns="Предмет")) is None
+    True
+    """
+    current_col = "Выкупили на сумму, ₽"
+    previous_col = "Выкупили на сумму, ₽ (предыдущий период)"
+    columns = ["Выкупили, шт", current_col]
+    if not {"Предмет", *columns} <= set(data.columns):
+        return None
+    has_previous = previous_col in data.columns
+    if has_previous:
+        columns.append(previous_col)
+
+    # Одна группировка дает и итоги, и разбивку по категориям
+    by_category = data.groupby("Предмет", dropna=False)[columns].sum()
+    totals = by_category.sum()
+    named = by_category[by_category.index.notna()]
+
+    # Код дизайнера ищется в любом месте артикула, как на странице
+    # "Анализ по дизайнеру", но только среди уникальных артикулов
+    designers = None
+    if "Артикул продавца" in data.columns:
+        articles = pd.Series(data["Артикул продавца"].dropna().astype(str).unique())
+        matches = articles.str.extractall(f"({'|'.join(DESIGNERS)})")
+        designers = int(matches[0].nunique())
+
+    summary = {
+        "units": int(totals["Выкупили, шт"]),
+        "revenue": float(totals[current_col]),
+        "previous_revenue": None,
+        "revenue_change": None,
+        "categories": len(named),
+        "designers": designers,
+        "top_movers": [],
+    }
+
+    if has_previous:
+        previous = float(totals[previous_col])
+        summary["previous_revenue"] = previous
+        if previous:
+            summary["revenue_change"] = (summary["revenue"] - previous) / previous * 100
+
+        delta = named[current_col] - named[previous_col]
+        delta = delta[delta != 0]
+        movers = delta.loc[delta.abs().nlargest(3).index]
+        summary["top_movers"] = list(movers.items())
+
+    return summary
+
+
 class LoginPage(QWidget):
     def __init__(self, stacked_widget):
         super().__init__()
@@ -58,6 +126,7 @@ class DashboardPage(QWidget):
     def __init__(self, stacked_widget):
         super().__init__()
         self.data = None
+        self.summary = None
         self.stacked_widget = stacked_widget
         self.init_ui()
 
@@ -76,6 +145,20 @@ class DashboardPage(QWidget):
         self.status = QLabel("")
         self.status.setStyleSheet("color: #7f8c8d; font-size: 12px;")
 
+        self.kpi_panel = QLabel("")
+        self.kpi_panel.setTextFormat(Qt.TextFormat.RichText)
+        self.kpi_panel.setStyleSheet("""
+            QLabel {
+                background-color: white;
+                border: 1px solid #ddd;
+                border-radius: 8px;
+                padding: 15px;
+                color: #2c3e50;
+                font-size: 14px;
+            }
+        """)
+        self.kpi_panel.setVisible(False)
+
         btn_layout = QVBoxLayout()
         btn_layout.setSpacing(15)
 
@@ -96,6 +179,7 @@ class DashboardPage(QWidget):
         layout.addWidget(self.label)
         layout.addWidget(self.load_btn)
         layout.addWidget(self.status)
+        layout.addWidget(self.kpi_panel)
         layout.addLayout(btn_layout)
 
         self.setLayout(layout)
@@ -117,6 +201,50 @@ class DashboardPage(QWidget):
                 QMessageBox.critical(self, "Ошибка", f"Не удалось загрузить файл: {e}")
                 self.status.setText("✗ Ошибка загрузки файла")
                 self.status.setStyleSheet("color: #e74c3c; font-size: 12px;")
+                return
+
+            # Сводка не должна мешать загрузке данных
+            try:
+                self.summary = compute_summary(self.data)
+            except Exception as e:
+                self.summary = None
+                self.kpi_panel.setText(f"<p><b>Сводка недоступна:</b> {html.escape(str(e))}</p>")
+                self.kpi_panel.setVisible(True)
+                return
+            self.show_summary()
+
+    def show_summary(self):
+        summary = self.summary
+        if summary is None:
+            self.kpi_panel.setText("<p><b>Сводка:</b> нет данных</p>")
+            self.kpi_panel.setVisible(True)
+            return
+
+        if summary["revenue_change"] is not None:
+            color = "#27ae60" if summary["revenue_change"] >= 0 else "#e74c3c"
+            change = (
+                f"<span style='color:{color}'>{summary['revenue_change']:+.1f}%</span> "
+                f"(было {summary['previous_revenue']:,.2f} ₽)"
+            )
+        else:
+            change = "нет данных"
+
+        designers = summary["designers"] if summary["designers"] is not None else "нет данных"
+
+        movers = "".join(
+            f"<li>{html.escape(str(category))}: {delta:+,.2f} ₽</li>"
+            for category, delta in summary["top_movers"]
+        ) or "<li>нет данных</li>"
+
+        self.kpi_panel.setText(
+            f"<p><b>Выкуплено, шт:</b> {summary['units']:,.0f}</p>"
+            f"<p><b>Выручка:</b> {summary['revenue']:,.2f} ₽</p>"
+            f"<p><b>К прошлому периоду:</b> {change}</p>"
+            f"<p><b>Категорий:</b> {summary['categories']} &nbsp; "
+            f"<b>Дизайнеров:</b> {designers}</p>"
+            f"<p><b>Наибольшие изменения выручки:</b></p><ul>{movers}</ul>"
+        )
+        self.kpi_panel.setVisible(True)
 
     def go_to_page(self, index):
         if self.data is not None:
@@ -369,7 +497,7 @@ class DesignerSearchPage(QWidget):
     def __init__(self):
         super().__init__()
         self.data = None
-        self.designers = ["VAA", "MVM", "KRG", "BRL", "BAS"]
+        self.designers = DESIGNERS
         self.init_ui()
 
     def init_ui(self):